@@ -47,8 +47,15 @@ def with_style(fn: JSONEncoderMethod) -> JSONEncoderMethod:
     return encode_with_style
 
 
+_TRANSLATIONS: dict[tuple[tuple[str, str | int | None], ...], dict[int, Any]] = {}
+"""Translation tables built by `escape_string`, keyed by the extra escapes"""
+
+
 def escape_string(string: str, **escapes: str | int | None) -> str:
-    out = string.translate(str.maketrans({**escapes, **ESCAPES}))
+    key = tuple(escapes.items())
+    if (table := _TRANSLATIONS.get(key)) is None:
+        table = _TRANSLATIONS[key] = str.maketrans({**escapes, **ESCAPES})
+    out = string.translate(table)
     if isinstance(string, JString):
         for line_break in string.linebreaks:
             out = out[: line_break - 1] + "\\\n" + out[line_break - 1 :]
@@ -65,14 +72,27 @@ class Encoder:
             (dict,): self.encode_dict,
             (list, tuple): self.encode_iterable,
         }
+        self.encode_cache: dict[type, Callable[[Any], None]] = {}
         self.fp = fp
 
+    def get_encode_func(self, typ: type) -> Callable[[Any], None]:
+        """
+        Resolve the encoder method for `typ`, caching it per concrete type.
+
+        `encode_func` is ordered, so the first matching entry wins just like
+        an `isinstance` chain would.
+        """
+        if (func := self.encode_cache.get(typ)) is None:
+            for typ_tuple, func in self.encode_func.items():
+                if issubclass(typ, typ_tuple):
+                    break
+            else:
+                raise NotImplementedError(f"Unknown type: {typ}")
+            self.encode_cache[typ] = func
+        return func
+
     def encode(self, obj: Any) -> None:
-        for typ_tuple, func in self.encode_func.items():
-            if isinstance(obj, typ_tuple):
-                func(obj)
-                return
-        raise NotImplementedError(f"Unknown type: {type(obj)}")
+        self.get_encode_func(type(obj))(obj)
 
     @with_style
     def encode_wrapper(self, obj: JWrapper) -> None:
@@ -28,6 +28,9 @@ from .types import (
     Value,
 )
 
+LINE_CONTINUATION = re.compile("\\\n")
+"""An escaped line break inside a string literal"""
+
 
 class Transformer(BaseTransformer):
     """
@@ -41,13 +44,13 @@ class Transformer(BaseTransformer):
     @v_args(inline=True)
     def SINGLE_QUOTE_CHARS(self, token: Token) -> tuple[str, list[int]]:
         return ast.literal_eval(f"'{token.value}'"), [
-            m.start() for m in re.finditer("\\\n", token.value)
+            m.start() for m in LINE_CONTINUATION.finditer(token.value)
         ]
 
     @v_args(inline=True)
     def DOUBLE_QUOTE_CHARS(self, token: Token) -> tuple[str, list[int]]:
         return ast.literal_eval(f'"{token.value}"'), [
-            m.start() for m in re.finditer("\\\n", token.value)
+            m.start() for m in LINE_CONTINUATION.finditer(token.value)
         ]
 
     @v_args(inline=True)
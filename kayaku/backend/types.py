@@ -65,6 +65,9 @@ class JContainer(JType):
 class WhiteSpace(str):
     """Stores a sequence of whitespaces"""
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self  # Never mutated, safe to share between copies
+
     def __repr__(self) -> str:
         return f"WhiteSpace({super().__repr__()})"
 
@@ -72,6 +75,9 @@ class WhiteSpace(str):
 class Comment(str):
     """Store a comment"""
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self  # Never mutated, safe to share between copies
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({super().__repr__()})"
 
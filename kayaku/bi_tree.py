@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Iterable, Sequence
 
 from .spec import DestWithMount, PathSpec, SourceSpec
 
 
 class Suffix:
+    __slots__ = ("bound", "nxt")
+
     bound: tuple[SourceSpec, PathSpec] | None
 
     def __init__(self) -> None:
@@ -15,7 +18,7 @@ class Suffix:
     def insert(self, frags: Iterable[str]) -> Suffix:
         node = self
         for frag in frags:
-            node = node.nxt.setdefault(frag, Suffix())
+            node = node.nxt.setdefault(sys.intern(frag), Suffix())
         return node
 
     def lookup(
@@ -34,6 +37,8 @@ class Suffix:
 
 
 class Prefix:
+    __slots__ = ("suffix", "nxt")
+
     suffix: Suffix | None
 
     def __init__(self) -> None:
@@ -43,7 +48,7 @@ class Prefix:
     def insert(self, frags: Iterable[str]) -> Suffix:
         node = self
         for frag in frags:
-            node = node.nxt.setdefault(frag, Prefix())
+            node = node.nxt.setdefault(sys.intern(frag), Prefix())
         if not node.suffix:
             node.suffix = Suffix()
         return node.suffix
@@ -61,10 +66,10 @@ class Prefix:
             suffix_ind, spec = self.suffix.lookup(reversed(frags[index:]))
             if spec:
                 src_spec, path_spec = spec
-                parts = (
-                    src_spec.section.prefix
-                    + list(frags[index : -suffix_ind or None])
-                    + src_spec.section.suffix
-                )
+                parts = [
+                    *src_spec.section.prefix,
+                    *frags[index : -suffix_ind or None],
+                    *src_spec.section.suffix,
+                ]
                 if formatted := path_spec.format(parts):
                     return spec, formatted
@@ -5,9 +5,12 @@ import inspect
 from dataclasses import Field
 from types import MappingProxyType
 from typing import cast
+from weakref import WeakKeyDictionary
 
 from loguru import logger
 
+_FIELD_DOCS: WeakKeyDictionary[type, dict[str, str]] = WeakKeyDictionary()
+
 
 def cleanup_src(src: str) -> str:
     lines = src.expandtabs().split("\n")
@@ -17,7 +20,7 @@ def cleanup_src(src: str) -> str:
     return "\n".join(lines)
 
 
-def store_field_description(cls: type, fields: dict[str, Field]) -> None:
+def parse_field_docs(cls: type) -> dict[str, str]:
     try:
         node: ast.ClassDef = cast(
             ast.ClassDef, ast.parse(cleanup_src(inspect.getsource(cls))).body[0]
@@ -26,19 +29,30 @@ def store_field_description(cls: type, fields: dict[str, Field]) -> None:
         logger.error(
             f"Unable to store description for {cls.__qualname__}, maybe the source file is not reachable."
         )
-        return
+        return {}
+    docs: dict[str, str] = {}
     for i, stmt in enumerate(node.body):
-        name: str | None = None
-        if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name):
-            name = stmt.target.id
         if (
-            name in fields
+            isinstance(stmt, ast.AnnAssign)
+            and isinstance(stmt.target, ast.Name)
             and i + 1 < len(node.body)
             and isinstance((doc_expr := node.body[i + 1]), ast.Expr)
             and isinstance((doc_const := doc_expr.value), ast.Constant)
             and isinstance(doc_string := doc_const.value, str)
-            and "description" not in (field := fields[name]).metadata
         ):
+            docs[stmt.target.id] = inspect.cleandoc(doc_string)
+    return docs
+
+
+def get_field_docs(cls: type) -> dict[str, str]:
+    if (docs := _FIELD_DOCS.get(cls)) is None:
+        docs = _FIELD_DOCS[cls] = parse_field_docs(cls)
+    return docs
+
+
+def store_field_description(cls: type, fields: dict[str, Field]) -> None:
+    for name, doc_string in get_field_docs(cls).items():
+        if name in fields and "description" not in (field := fields[name]).metadata:
             field.metadata = MappingProxyType(
-                {**field.metadata.copy(), "description": inspect.cleandoc(doc_string)}
+                {**field.metadata.copy(), "description": doc_string}
             )
@@ -1,6 +1,5 @@
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
-from dataclasses import fields as get_fields
 from pathlib import Path
 from typing import Any, Literal, TypeAlias, TypeVar, overload
 
@@ -11,7 +10,7 @@ from .format import format_with_model
 from .pretty import Prettifier
 from .schema_gen import DataClass, SchemaGenerator, update_schema_ref
 from .spec import DestWithMount, PathSpec, SourceSpec, parse_path, parse_source
-from .utils import from_dict, to_path, touch_path, update
+from .utils import field_names, from_dict, to_path, touch_path, update
 
 SchemaGenCallable: TypeAlias = Callable[[type[DataClass] | None], SchemaGenerator]
 StrStrip: TypeAlias = tuple[str, ...]
@@ -60,7 +59,7 @@ class _KayakuCore:
         target_nd = self.root.insert(prefix).insert(reversed(suffix))
         if target_nd.bound:
             raise ValueError(
-                f"{'.'.join(prefix + ['*'] + suffix)} is already bound to {target_nd.bound}"
+                f"{'.'.join((*prefix, '*', *suffix))} is already bound to {target_nd.bound}"
             )
         target_nd.bound = (src, path)
 
@@ -77,8 +76,8 @@ class _KayakuCore:
         file_store = self.files.setdefault(
             path, _FileEntry(self.get_schema_generator(None))
         )
-        for dc_field in get_fields(cls):
-            sub_dest: MountIdent = mount + (dc_field.name,)
+        for name in field_names(cls):
+            sub_dest: MountIdent = mount + (name,)
             if sub_dest in file_store.mount_record:
                 raise NameError(
                     f"{path.with_suffix('').as_posix()}::{'.'.join(sub_dest)} is occupied!"
@@ -283,6 +282,8 @@ class Kayaku:
         cls_entry.path.write_text(
             dumps(self._core.prettifier.prettify(document), endline=True), "utf-8"
         )
-        touch_path(cls_entry.path.with_suffix(".schema.json")).with_suffix(
-            ".schema.json"
-        ).write_text(dumps(self._core.files[cls_entry.path].get_schema()), "utf-8")
+        # The schema lives next to the config file written above, so its
+        # directory is known to exist and the file needs no separate touch.
+        cls_entry.path.with_suffix(".schema.json").write_text(
+            dumps(self._core.files[cls_entry.path].get_schema()), "utf-8"
+        )
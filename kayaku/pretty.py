@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
 from typing import Literal, TypeVar
 
@@ -34,9 +35,24 @@ IDENTIFIER_PATTERN = regex.compile(
 )
 
 
+@functools.lru_cache(maxsize=512)
+def _comment_lines(comment: str) -> tuple[str, ...]:
+    """Split a block comment into its dedented lines, reused for repeated comments."""
+    return tuple(inspect.cleandoc(comment).splitlines())
+
+
 class Prettifier:
     """容器格式化工具"""
 
+    __slots__ = (
+        "indent",
+        "trail_comma",
+        "key_quote",
+        "string_quote",
+        "unfold_single",
+        "layer",
+    )
+
     def __init__(
         self,
         indent: int = 4,
@@ -93,7 +109,7 @@ class Prettifier:
         return res
 
     def gen_comment_block(self, comment: str) -> BlockStyleComment:
-        lines: list[str] = inspect.cleandoc(comment).splitlines()
+        lines: list[str] = list(_comment_lines(comment))
         if len(lines) <= 1:
             return BlockStyleComment(comment)
         lines = self.clean_comment(lines)
@@ -141,9 +157,11 @@ class Prettifier:
                 if IDENTIFIER_PATTERN.fullmatch(obj)
                 else JString(obj).__post_init__(Quote.DOUBLE)
             )
-        obj = convert(obj)
-        string.json_before = obj.json_before
-        string.json_after = obj.json_after
+        if isinstance(obj, JType):
+            string.json_before = obj.json_before
+            string.json_after = obj.json_after
+        else:
+            string.__json_clear__()
         return string
 
     def prettify_object(self, obj: JObject) -> JObject:
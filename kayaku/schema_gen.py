@@ -28,6 +28,7 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import copy
 import dataclasses
 import datetime
 import enum
@@ -35,6 +36,7 @@ import inspect
 import numbers
 import re
 import typing as t
+from weakref import WeakKeyDictionary
 
 import typing_extensions as t_e
 
@@ -43,6 +45,14 @@ from .utils import DataClass, EmptyTypedDict, Unions, is_sub_type
 
 _MISSING = dataclasses.MISSING
 
+_TYPE_HINTS: WeakKeyDictionary[type, dict[str, t.Any]] = WeakKeyDictionary()
+
+
+def resolve_type_hints(typ: type) -> dict[str, t.Any]:
+    if (hints := _TYPE_HINTS.get(typ)) is None:
+        hints = _TYPE_HINTS[typ] = t_e.get_type_hints(typ, include_extras=True)
+    return hints
+
 
 _Format = t.Literal[
     "date-time",
@@ -115,6 +125,10 @@ class ContainerSchema(Schema):
 
 
 class SchemaGenerator:
+    _schema_cache: t.ClassVar[
+        WeakKeyDictionary[type, dict[type[SchemaGenerator], dict[str, t.Any]]]
+    ] = WeakKeyDictionary()
+
     def __init__(self, dc: type[DataClass] | None = None) -> None:
         self.root = dc
         self.seen_root = False
@@ -133,15 +147,17 @@ class SchemaGenerator:
 
     @classmethod
     def from_dc(cls, dc: type[DataClass]) -> dict[str, t.Any]:
-        generator = cls(dc)
-        schema = generator.get_dc_schema(dc)
-        if generator.defs:
-            schema["$defs"] = generator.defs
-
-        return {
-            "$schema": "https://json-schema.org/draft/2020-12/schema",
-            **schema,
-        }
+        cached = cls._schema_cache.setdefault(dc, {})
+        if (schema := cached.get(cls)) is None:
+            generator = cls(dc)
+            schema = generator.get_dc_schema(dc)
+            if generator.defs:
+                schema["$defs"] = generator.defs
+            schema = cached[cls] = {
+                "$schema": "https://json-schema.org/draft/2020-12/schema",
+                **schema,
+            }
+        return copy.deepcopy(schema)
 
     def get_dc_schema(self, dc: type[DataClass]) -> dict[str, t.Any]:
         if dc == self.root:
@@ -159,20 +175,21 @@ class SchemaGenerator:
             }
 
     def create_dc_schema(self, dc: type[DataClass]):
-        schema = {
-            "type": "object",
-            "title": self.retrieve_title(dc),
-            "properties": {},
-            "required": [],
-        }
         store_field_description(dc, dc.__dataclass_fields__)
-        type_hints = t.get_type_hints(dc, include_extras=True)
+        type_hints = resolve_type_hints(dc)
+        title = self.retrieve_title(dc)
+        # Checked before the field loop, which may rewrite annotations in the signature.
+        # inspect.signature is only rendered when __doc__ may be the generated one.
+        description = dc.__doc__
         if (
-            dc.__doc__ is not None
-            and dc.__doc__
-            != f"{dc.__name__}{str(inspect.signature(dc)).replace(' -> None', '')}"  # Ignore the generated __doc__
+            description is not None
+            and description.startswith(f"{dc.__name__}(")
+            and description
+            == f"{dc.__name__}{str(inspect.signature(dc)).replace(' -> None', '')}"  # Ignore the generated __doc__
         ):
-            schema["description"] = dc.__doc__
+            description = None
+        properties: dict[str, t.Any] = {}
+        required: list[str] = []
         for field in dataclasses.fields(dc):
             typ: t.Any = type_hints[field.name]
             if (f_description := field.metadata.get("description")) is not None:
@@ -189,14 +206,14 @@ class SchemaGenerator:
                         self.format_docstring_description(field, f_description),
                     )
                 typ = t.Annotated[base, f_a]
-            schema["properties"][field.name] = self.get_field_schema(typ, field.default)
-            field_is_optional = (
-                field.default is not _MISSING or field.default_factory is not _MISSING
-            )
-            if not field_is_optional:
-                schema["required"].append(field.name)
-        if not schema["required"]:
-            schema.pop("required")
+            properties[field.name] = self.get_field_schema(typ, field.default)
+            if field.default is _MISSING and field.default_factory is _MISSING:
+                required.append(field.name)
+        schema = {"type": "object", "title": title, "properties": properties}
+        if required:
+            schema["required"] = required
+        if description is not None:
+            schema["description"] = description
         return schema
 
     def get_simple_schema(self, typ: type, default: t.Any):
@@ -222,13 +239,14 @@ class SchemaGenerator:
             return self.get_regex_schema()
 
     def get_complex_schema(self, typ: type, default: t.Any):
+        origin = t.get_origin(typ)
         if dataclasses.is_dataclass(typ):
             return self.get_dc_schema(typ)
-        elif t.get_origin(typ) in Unions:
+        elif origin in Unions:
             return self.get_union_schema(typ, default)
-        elif t.get_origin(typ) == t.Literal:
+        elif origin is t.Literal:
             return self.get_literal_schema(typ, default)
-        elif t.get_origin(typ) == t.Annotated:
+        elif origin is t.Annotated:
             return self.get_annotated_schema(typ, default)
         elif t.is_typeddict(typ) or t_e.is_typeddict(typ):
             return self.get_typed_dict_schema(typ)
@@ -283,7 +301,7 @@ class SchemaGenerator:
     def get_typed_dict_schema(self, typ: type[EmptyTypedDict]):
         fields: list[tuple[str, t.Any]] = []
         required: list[str] = []  # Python 3.8- don't have `__required_keys__`
-        for name, anno in t_e.get_type_hints(typ, include_extras=True).items():
+        for name, anno in resolve_type_hints(typ).items():
             anno: t.Any
             schema_anno: Schema | None = None
             if t_e.get_origin(anno) == t_e.Annotated:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import enum
+import functools
 import re
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from typing import TypedDict, cast
 
 _LIG = r"[A-Za-z0-9_-]"
@@ -13,16 +15,16 @@ SOURCE_REGEX = re.compile(
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SectionSpec:
-    prefix: list[str]
-    suffix: list[str]
+    prefix: tuple[str, ...]
+    suffix: tuple[str, ...]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SourceSpec:
-    prefix: list[str]
-    suffix: list[str]
+    prefix: tuple[str, ...]
+    suffix: tuple[str, ...]
     section: SectionSpec
 
 
@@ -33,16 +35,18 @@ class SourceRegexGroup(TypedDict):
     suffix: str
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_source(spec: str) -> SourceSpec:
     if not (match_res := SOURCE_REGEX.fullmatch(spec)):
         raise ValueError(f"{spec!r} doesn't match {SOURCE_REGEX.pattern!r}")
     groups: SourceRegexGroup = cast(SourceRegexGroup, match_res.groupdict())
     section: SectionSpec = SectionSpec(
-        groups["sect_prefix"].split(".")[:-1], groups["sect_suffix"].split(".")[1:]
+        tuple(groups["sect_prefix"].split(".")[:-1]),
+        tuple(groups["sect_suffix"].split(".")[1:]),
     )
     return SourceSpec(
-        groups["prefix"].split(".")[:-1] + section.prefix,
-        section.suffix + groups["suffix"].split(".")[1:],
+        (*groups["prefix"].split(".")[:-1], *section.prefix),
+        (*section.suffix, *groups["suffix"].split(".")[1:]),
         section,
     )
 
@@ -52,18 +56,49 @@ class PathFill(enum.Enum):
     EXTEND = object()  # {**}
 
 
-@dataclass
-class PathSpec:
-    path: list[str | PathFill]
-    section: list[str | PathFill]
+PATH_FILLS: dict[str, PathFill] = {
+    "{*}": PathFill.SINGLE,
+    "{}": PathFill.SINGLE,
+    "{**}": PathFill.EXTEND,
+}
+
 
-    @property
-    def fill_lens(self) -> tuple[int, int]:
-        fills = [i for i in self.path + self.section if isinstance(i, PathFill)]
-        if PathFill.EXTEND not in fills:
-            return len(fills), 0
-        ext_ind = fills.index(PathFill.EXTEND)
-        return ext_ind, len(fills) - ext_ind - 1
+@dataclass(frozen=True, slots=True)
+class PathSpec:
+    path: tuple[str | PathFill, ...]
+    section: tuple[str | PathFill, ...]
+    fill_lens: tuple[int, int] = field(init=False, repr=False, compare=False)
+    extendable: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Computed once here instead of on every `format` call.
+        fill_cnt: int = 0
+        ext_ind: int | None = None
+        for part in self.path + self.section:
+            if part is PathFill.SINGLE:
+                fill_cnt += 1
+            elif part is PathFill.EXTEND:
+                if ext_ind is None:
+                    ext_ind = fill_cnt
+                fill_cnt += 1
+        if ext_ind is None:
+            fill_lens = fill_cnt, 0
+        else:
+            fill_lens = ext_ind, fill_cnt - ext_ind - 1
+        object.__setattr__(self, "fill_lens", fill_lens)
+        object.__setattr__(self, "extendable", ext_ind is not None)
+
+    @staticmethod
+    def _fill(
+        spec: tuple[str | PathFill, ...], formatted_it: Iterator[str], ext: list[str]
+    ) -> list[str]:
+        res: list[str] = []
+        for p in spec:
+            if p is PathFill.EXTEND:
+                res.extend(ext)
+            else:
+                res.append(next(formatted_it) if p is PathFill.SINGLE else p)
+        return res
 
     def format(self, parts: list[str]) -> DestWithMount | None:
         front_len, back_len = self.fill_lens
@@ -73,40 +108,31 @@ class PathSpec:
         if (
             len(front) != front_len
             or len(back) != back_len
-            or (ext and PathFill.EXTEND not in self.path + self.section)
+            or (ext and not self.extendable)
         ):
             return
         formatted_it = iter(front + back)
-
-        fmt_path: list[str] = []
-        for p in self.path:
-            if p is PathFill.EXTEND:
-                fmt_path.extend(ext)
-            else:
-                fmt_path.append(next(formatted_it) if p is PathFill.SINGLE else p)
-        fmt_sect: list[str] = []
-        for p in self.section:
-            if p is PathFill.EXTEND:
-                fmt_sect.extend(ext)
-            else:
-                fmt_sect.append(next(formatted_it) if p is PathFill.SINGLE else p)
+        fmt_path = self._fill(self.path, formatted_it, ext)
+        fmt_sect = self._fill(self.section, formatted_it, ext)
         return DestWithMount("/".join(fmt_path), tuple(fmt_sect))  # Allow absolute path
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DestWithMount:
     dest: str
     mount: tuple[str, ...]
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_path(spec: str) -> PathSpec:
-    replacer = {"{*}": PathFill.SINGLE, "{}": PathFill.SINGLE, "{**}": PathFill.EXTEND}
     location, section = spec.rsplit("::", 1) if "::" in spec else (spec, "")
-    path_parts: list[str | PathFill] = [
-        replacer.get(loc, loc) for loc in location.split("/")
-    ]
-    section_parts: list[str | PathFill] = (
-        [replacer.get(sect, sect) for sect in section.split(".")] if section else []
+    path_parts: tuple[str | PathFill, ...] = tuple(
+        PATH_FILLS.get(loc, loc) for loc in location.split("/")
+    )
+    section_parts: tuple[str | PathFill, ...] = (
+        tuple(PATH_FILLS.get(sect, sect) for sect in section.split("."))
+        if section
+        else ()
     )
     if path_parts.count(PathFill.EXTEND) + section_parts.count(PathFill.EXTEND) > 1:
         raise ValueError(f"""Found more than one "extend" part ({{**}}) in {spec}""")
@@ -18,6 +18,7 @@ from typing import (
     get_origin,
     runtime_checkable,
 )
+from weakref import WeakKeyDictionary
 
 import typing_extensions
 from dacite.config import Config
@@ -48,6 +49,15 @@ DC_T = TypeVar("DC_T", bound=DataClass)
 T = TypeVar("T")
 
 
+_FIELD_NAMES: WeakKeyDictionary[type, tuple[str, ...]] = WeakKeyDictionary()
+
+
+def field_names(cls: type[DataClass]) -> tuple[str, ...]:
+    if (names := _FIELD_NAMES.get(cls)) is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return names
+
+
 def copy_meta(src: Any, dst: JType):
     if isinstance(dst, JContainer):
         dst.json_container_tail = getattr(
@@ -57,20 +67,55 @@ def copy_meta(src: Any, dst: JType):
     dst.json_after = getattr(src, "json_after", dst.json_after)
 
 
+class _ValueKind(enum.Enum):
+    OBJECT = enum.auto()
+    PATTERN = enum.auto()
+    ISO = enum.auto()
+    ENUM = enum.auto()
+    SEQUENCE = enum.auto()
+    PLAIN = enum.auto()
+
+
+_VALUE_KINDS: WeakKeyDictionary[type, _ValueKind] = WeakKeyDictionary()
+
+
+def _classify_value(typ: type) -> _ValueKind:
+    if hasattr(typ, "__dataclass_fields__") or issubclass(typ, dict):
+        return _ValueKind.OBJECT
+    if issubclass(typ, re.Pattern):
+        return _ValueKind.PATTERN
+    if issubclass(typ, date | datetime | time):
+        return _ValueKind.ISO
+    if issubclass(typ, enum.Enum):
+        return _ValueKind.ENUM
+    if issubclass(typ, Sequence) and not issubclass(typ, str):
+        return _ValueKind.SEQUENCE
+    return _ValueKind.PLAIN
+
+
+def _value_kind(typ: type) -> _ValueKind:
+    # Resolved once per value type: isinstance checks against the DataClass
+    # protocol and the Sequence ABC are slow and update() runs them per value.
+    if (kind := _VALUE_KINDS.get(typ)) is None:
+        kind = _VALUE_KINDS[typ] = _classify_value(typ)
+    return kind
+
+
 def _update_array(container: Array, data: list):
     for i in range(len(container)):
         val = container[i]
-        if isinstance(val, DataClass | dict):
+        kind = _value_kind(type(val))
+        if kind is _ValueKind.OBJECT:
             new_container = JObject()
             update(new_container, val, delete=True)
             val = new_container
-        elif isinstance(val, re.Pattern | date | datetime | time):
-            val = convert(
-                val.pattern if isinstance(val, re.Pattern) else val.isoformat()
-            )
-        elif isinstance(val, enum.Enum):
+        elif kind is _ValueKind.PATTERN:
+            val = convert(val.pattern)
+        elif kind is _ValueKind.ISO:
+            val = convert(val.isoformat())
+        elif kind is _ValueKind.ENUM:
             val = convert(val.value)
-        elif isinstance(val, Sequence) and not isinstance(val, str):
+        elif kind is _ValueKind.SEQUENCE:
             val: JType = convert(val if isinstance(val, list) else list(val))
             _update_array(val, [])
         else:
@@ -84,24 +129,27 @@ def _update_array(container: Array, data: list):
 
 
 def update(container: JObject, data: DataClass | dict, delete: bool = False):
-    if isinstance(data, DataClass):
-        k_v_pairs = {f.name: getattr(data, f.name) for f in fields(data)}
-    else:
+    if isinstance(data, dict):
         k_v_pairs = data
+    else:
+        k_v_pairs = {name: getattr(data, name) for name in field_names(type(data))}
     to_be_popped: set[str] = set(container.keys() if delete else ())
     for k, v in k_v_pairs.items():
         k = convert(k)
         to_be_popped.discard(k)
         origin_v = container.get(k, None)
-        if isinstance(v, DataClass | dict):
+        kind = _value_kind(type(v))
+        if kind is _ValueKind.OBJECT:
             new_v = container.setdefault(k, JObject())
             update(new_v, v, delete=True)
             v = new_v
-        elif isinstance(v, re.Pattern | date | datetime | time):
-            v = convert(v.pattern if isinstance(v, re.Pattern) else v.isoformat())
-        elif isinstance(v, enum.Enum):
+        elif kind is _ValueKind.PATTERN:
+            v = convert(v.pattern)
+        elif kind is _ValueKind.ISO:
+            v = convert(v.isoformat())
+        elif kind is _ValueKind.ENUM:
             v = convert(v.value)
-        elif isinstance(v, Sequence) and not isinstance(v, str):
+        elif kind is _ValueKind.SEQUENCE:
             v: JType = convert(v if isinstance(v, list) else list(v))
             _update_array(v, origin_v or [])
         else:
@@ -174,15 +222,14 @@ class _KayakuDaciteTypeHook(dict):
 _TYPE_HOOK = _KayakuDaciteTypeHook()
 
 
+_DACITE_CONFIG = Config(
+    type_hooks=_TYPE_HOOK,
+    cast=[enum.Enum],
+)
+
+
 def from_dict(model: type[DC_T], data: dict[str, Any]) -> DC_T:
-    return _from_dict(
-        model,
-        data,
-        Config(
-            type_hooks=_TYPE_HOOK,
-            cast=[enum.Enum],
-        ),
-    )
+    return _from_dict(model, data, _DACITE_CONFIG)
 
 
 if not TYPE_CHECKING:
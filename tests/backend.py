@@ -1,4 +1,5 @@
 import io
+from copy import deepcopy
 
 import pytest
 
@@ -70,6 +71,15 @@ def test_backend_round_trip():
     assert out_io.getvalue() == test_input
 
 
+def test_deepcopy():
+    obj = backend.loads(test_input)
+    copied = deepcopy(obj)
+    assert backend.dumps(copied) == test_input
+    copied["next"]["dct"].json_before.clear()
+    copied["next"]["dct"].pop()
+    assert backend.dumps(obj) == test_input
+
+
 def test_round_trip_raw():
     commented = "/*abc*/ 5"
     assert backend.dumps(backend.loads(commented)) == commented
@@ -1,12 +1,46 @@
-import shutil
 from pathlib import Path
 
 import pytest
 
-base_pth = Path("./temp/storage/").resolve()
-if base_pth.exists():
-    shutil.rmtree(base_pth.as_posix())
-base_pth.mkdir(parents=True, exist_ok=True)
+from kayaku.bi_tree import Prefix
+from kayaku.spec import (
+    DestWithMount,
+    PathFill,
+    PathSpec,
+    SectionSpec,
+    SourceSpec,
+    parse_path,
+    parse_source,
+)
+
+EMPTY_SECTION = SectionSpec((), ())
+EXTEND_SECTION = (PathFill.EXTEND,)
+
+SRC_ABC_DEF = SourceSpec(("a", "b", "c"), ("d", "e", "f"), EMPTY_SECTION)
+SRC_ABC_DE_CREDENTIAL = SourceSpec(
+    ("a", "b", "c"), ("d", "e", "credential"), EMPTY_SECTION
+)
+SRC_ABCXXX = SourceSpec(("a", "b", "c", "xxx"), (), EMPTY_SECTION)
+SRC_ABCD_EF = SourceSpec(("a", "b", "c", "d"), ("e", "f"), EMPTY_SECTION)
+SRC_ABCD_OPEF = SourceSpec(("a", "b", "c", "d"), ("o", "p", "e", "f"), EMPTY_SECTION)
+
+KEY_ABCXXX_DEF = ("a", "b", "c", "xxx", "d", "e", "f")
+KEY_ABCD_E_CREDENTIAL = ("a", "b", "c", "d", "e", "credential")
+KEY_ABCD_PXXX_EF = ("a", "b", "c", "d", "p", "xxx", "e", "f")
+KEY_ABCD_OPEF = ("a", "b", "c", "d", "o", "p", "e", "f")
+KEY_ABCD_RAND = ("a", "b", "c", "d", "rand")
+KEY_ABCD_XXX_F = ("a", "b", "c", "d", "xxx", "f")
+KEY_ABCDE = ("a", "b", "c", "d", "e")
+
+
+@pytest.fixture(scope="module")
+def base_pth(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("storage")
+
+
+@pytest.fixture
+def root() -> Prefix:
+    return Prefix()
 
 
 def insert_spec(root, src, path) -> None:
@@ -14,147 +48,84 @@ def insert_spec(root, src, path) -> None:
     target_nd = root.insert(prefix).insert(reversed(suffix))
     if target_nd.bound:
         raise ValueError(
-            f"{'.'.join(prefix + ['*'] + suffix)} is already bound to {target_nd.bound}"
+            f"{'.'.join((*prefix, '*', *suffix))} is already bound to {target_nd.bound}"
         )
     target_nd.bound = (src, path)
 
 
-def test_insert_spec():
-    import kayaku.bi_tree
-    from kayaku.spec import PathSpec, SectionSpec, SourceSpec
-
-    root = kayaku.bi_tree.Prefix()
-    empty = SectionSpec([], [])
+def test_insert_spec(root: Prefix, base_pth: Path):
+    parts = base_pth.parts
+    credential_pth = PathSpec((*parts, "credential"), ())
 
-    insert_spec(
-        root,
-        SourceSpec(["a", "b", "c"], ["d", "e", "f"], empty),
-        PathSpec([*base_pth.parts, "config"], []),
-    )
-
-    insert_spec(
-        root,
-        SourceSpec(["a", "b", "c"], ["d", "e", "credential"], empty),
-        PathSpec([*base_pth.parts, "credential"], []),
-    )
+    insert_spec(root, SRC_ABC_DEF, PathSpec((*parts, "config"), ()))
+    insert_spec(root, SRC_ABC_DE_CREDENTIAL, credential_pth)
 
     with pytest.raises(ValueError):
-        insert_spec(
-            root,
-            SourceSpec(["a", "b", "c"], ["d", "e", "credential"], empty),
-            PathSpec([*base_pth.parts, "credential"], []),
-        )
+        insert_spec(root, SRC_ABC_DE_CREDENTIAL, credential_pth)
 
 
-def test_lookup_spec():
-    import kayaku.bi_tree
-    import kayaku.spec
-    from kayaku.spec import PathFill, PathSpec, SectionSpec, SourceSpec
+def test_lookup_spec(root: Prefix, base_pth: Path):
+    parts = base_pth.parts
+    hmm_pth = PathSpec((*parts, "hmm"), EXTEND_SECTION)
+    credential_pth = PathSpec((*parts, "credential"), EXTEND_SECTION)
+    any_pth = PathSpec((*parts, "any"), EXTEND_SECTION)
+    whirl_pth = PathSpec((*parts, "whirl"), EXTEND_SECTION)
 
-    empty = SectionSpec([], [])
+    insert_spec(root, SRC_ABC_DEF, PathSpec((*parts, "config"), EXTEND_SECTION))
+    insert_spec(root, SRC_ABCXXX, hmm_pth)
+    insert_spec(root, SRC_ABC_DE_CREDENTIAL, credential_pth)
+    insert_spec(root, SRC_ABCD_EF, any_pth)
+    insert_spec(root, SRC_ABCD_OPEF, whirl_pth)
 
-    root = kayaku.bi_tree.Prefix()
-    path_sect = [PathFill.EXTEND]
+    p = root.lookup(KEY_ABCXXX_DEF)
+    assert p and p[0] == (SRC_ABCXXX, hmm_pth)
 
-    insert_spec(
-        root,
-        SourceSpec(["a", "b", "c"], ["d", "e", "f"], empty),
-        PathSpec([*base_pth.parts, "config"], path_sect),
-    )
+    p = root.lookup(KEY_ABCD_E_CREDENTIAL)
+    assert p and p[0] == (SRC_ABC_DE_CREDENTIAL, credential_pth)
 
-    insert_spec(
-        root,
-        SourceSpec(
-            ["a", "b", "c", "xxx"],
-            [],
-            empty,
-        ),
-        PathSpec([*base_pth.parts, "hmm"], path_sect),
-    )
+    p = root.lookup(KEY_ABCD_PXXX_EF)
+    assert p and p[0] == (SRC_ABCD_EF, any_pth)
 
-    insert_spec(
-        root,
-        SourceSpec(["a", "b", "c"], ["d", "e", "credential"], empty),
-        PathSpec([*base_pth.parts, "credential"], path_sect),
-    )
-
-    insert_spec(
-        root,
-        SourceSpec(["a", "b", "c", "d"], ["e", "f"], empty),
-        PathSpec([*base_pth.parts, "any"], path_sect),
-    )
-
-    insert_spec(
-        root,
-        SourceSpec(["a", "b", "c", "d"], ["o", "p", "e", "f"], empty),
-        PathSpec([*base_pth.parts, "whirl"], path_sect),
-    )
-
-    assert (p := root.lookup(["a", "b", "c", "xxx", "d", "e", "f"])) and p[0] == (
-        SourceSpec(["a", "b", "c", "xxx"], [], empty),
-        PathSpec([*base_pth.parts, "hmm"], path_sect),
-    )
-
-    assert (p := root.lookup(["a", "b", "c", "d", "e", "credential"])) and p[0] == (
-        SourceSpec(["a", "b", "c"], ["d", "e", "credential"], empty),
-        PathSpec([*base_pth.parts, "credential"], path_sect),
-    )
+    p = root.lookup(KEY_ABCD_OPEF)
+    assert p and p[0] == (SRC_ABCD_OPEF, whirl_pth)
 
-    assert (p := root.lookup(["a", "b", "c", "d", "p", "xxx", "e", "f"])) and p[0] == (
-        SourceSpec(["a", "b", "c", "d"], ["e", "f"], empty),
-        PathSpec([*base_pth.parts, "any"], path_sect),
-    )
-
-    assert (p := root.lookup(["a", "b", "c", "d", "o", "p", "e", "f"])) and p[0] == (
-        SourceSpec(["a", "b", "c", "d"], ["o", "p", "e", "f"], empty),
-        PathSpec([*base_pth.parts, "whirl"], path_sect),
-    )
+    assert root.lookup(KEY_ABCD_RAND) is None
 
-    assert root.lookup(["a", "b", "c", "d", "rand"]) is None
+    assert root.lookup(KEY_ABCD_XXX_F) is None
 
-    assert root.lookup(["a", "b", "c", "d", "xxx", "f"]) is None
 
-
-def test_spec_lookup_fmt_err():
-    import kayaku.bi_tree
-    from kayaku.spec import DestWithMount, parse_path, parse_source
-
-    root = kayaku.bi_tree.Prefix()
+def test_spec_lookup_fmt_err(root: Prefix, base_pth: Path):
+    posix = base_pth.as_posix()
     insert_spec(
         root,
         parse_source("a.b.c.{**}"),
-        parse_path(base_pth.as_posix() + "/a/b/c::{}"),
+        parse_path(posix + "/a/b/c::{}"),
     )
 
     insert_spec(
         root,
         parse_source("a.b.{**}"),
-        parse_path(base_pth.as_posix() + "/d/e/f::{**}"),
+        parse_path(posix + "/d/e/f::{**}"),
     )
 
-    assert (p := root.lookup(["a", "b", "c", "d", "e"])) and p[1] == DestWithMount(
-        Path(base_pth, "d/e/f").as_posix(), ("c", "d", "e")
-    )
+    p = root.lookup(KEY_ABCDE)
+    assert p and p[1] == DestWithMount(f"{posix}/d/e/f", ("c", "d", "e"))
 
 
-def test_spec_lookup_wrapped():
-    import kayaku.bi_tree
-    from kayaku.spec import DestWithMount, parse_path, parse_source
-
-    root = kayaku.bi_tree.Prefix()
+def test_spec_lookup_wrapped(root: Prefix, base_pth: Path):
+    posix = base_pth.as_posix()
     insert_spec(
         root,
         parse_source("a.b.c.{**}"),
-        parse_path(base_pth.as_posix() + "/a/b/c::{}"),
+        parse_path(posix + "/a/b/c::{}"),
     )
-    assert root.lookup(["a", "b", "c", "d", "e"]) is None
+    assert root.lookup(KEY_ABCDE) is None
 
     insert_spec(
         root,
         parse_source("a.b.{**}"),
-        parse_path(base_pth.as_posix() + "/d/e/f.jsonc::{**}"),
+        parse_path(posix + "/d/e/f.jsonc::{**}"),
     )
 
-    assert root.lookup(["a", "b", "c", "d", "e"])[1] == DestWithMount(
-        Path(base_pth, "d/e/f.jsonc").as_posix(), ("c", "d", "e")
-    )
+    p = root.lookup(KEY_ABCDE)
+    assert p and p[1] == DestWithMount(f"{posix}/d/e/f.jsonc", ("c", "d", "e"))
@@ -4,6 +4,10 @@ from helper import prettifier
 
 from kayaku import backend as json5
 from kayaku.backend.types import Quote, convert
+from kayaku.pretty import Prettifier
+
+PRETTIFIER = prettifier()
+UNFOLDED_PRETTIFIER = prettifier(unfold_single=True)
 
 
 def test_pretty_single_wrapped():
@@ -11,7 +15,7 @@ def test_pretty_single_wrapped():
     expected = ["""{"a": "b"}""", """{"a": 1}""", """[1]""", """["acc"]""", "[]", "{}"]
 
     for o, e in zip(origins, expected, strict=False):
-        assert json5.dumps(prettifier().prettify(o)) == e
+        assert json5.dumps(PRETTIFIER.prettify(o)) == e
 
 
 def test_pretty_single_unwrapped():
@@ -23,10 +27,7 @@ def test_pretty_single_unwrapped():
         }
         """
     )
-    assert (
-        json5.dumps(prettifier(unfold_single=True).prettify(origin))
-        == expected_unwrapped
-    )
+    assert json5.dumps(UNFOLDED_PRETTIFIER.prettify(origin)) == expected_unwrapped
     origin = convert({"a": 1})
     expected_unwrapped = inspect.cleandoc(
         """\
@@ -35,10 +36,7 @@ def test_pretty_single_unwrapped():
         }
         """
     )
-    assert (
-        json5.dumps(prettifier(unfold_single=True).prettify(origin))
-        == expected_unwrapped
-    )
+    assert json5.dumps(UNFOLDED_PRETTIFIER.prettify(origin)) == expected_unwrapped
 
 
 def test_pretty_complex():
@@ -59,7 +57,7 @@ def test_pretty_complex():
         }
         """
     )
-    assert json5.dumps(prettifier().prettify(convert(obj))) == result
+    assert json5.dumps(PRETTIFIER.prettify(convert(obj))) == result
 
 
 def test_pretty_flavor():
@@ -169,4 +167,32 @@ def test_pretty_comment():
         """
     )
 
-    assert json5.dumps(prettifier().prettify(json5.loads(input_str))) == output
+    assert json5.dumps(PRETTIFIER.prettify(json5.loads(input_str))) == output
+
+
+def test_pretty_comment_override():
+    class UpperPrettifier(Prettifier):
+        @staticmethod
+        def clean_comment(lines: list[str]) -> list[str]:
+            return [i.upper() for i in Prettifier.clean_comment(lines)]
+
+    input_str = """{
+        /*
+        first
+        second
+        */
+        "a": 1,
+    }"""
+    output = inspect.cleandoc(
+        """\
+        {
+            /*
+             * FIRST
+             * SECOND
+             */
+            "a": 1
+        }
+        """
+    )
+    prettifier = UpperPrettifier(trail_comma=False, key_quote=Quote.DOUBLE)
+    assert json5.dumps(prettifier.prettify(json5.loads(input_str))) == output
@@ -31,11 +31,14 @@ from __future__ import annotations
 import dataclasses
 import datetime
 import enum
+import functools
+import json
 import re
 import typing as t
 
 import pytest
 import typing_extensions as t_e
+from jsonschema.exceptions import SchemaError
 from jsonschema.validators import Draft202012Validator
 
 from kayaku.schema_gen import (
@@ -48,15 +51,33 @@ from kayaku.schema_gen import (
 )
 
 
-def get_schema(obj: type[DataClass]):
-    class NameOnlyGen(SchemaGenerator):
-        def retrieve_name(self, typ: type) -> str:
-            return typ.__name__
+class NameOnlyGen(SchemaGenerator):
+    def retrieve_name(self, typ: type) -> str:
+        return typ.__name__
+
 
+@functools.lru_cache(maxsize=None)
+def get_schema(obj: type[DataClass]):
     return NameOnlyGen.from_dc(obj)
 
 
-@dataclasses.dataclass
+_META_VALIDATOR = Draft202012Validator(
+    Draft202012Validator.META_SCHEMA,
+    format_checker=Draft202012Validator.FORMAT_CHECKER,
+)
+_checked_schemas: set[str] = set()
+
+
+def check_schema(schema: dict[str, t.Any]) -> None:
+    key = json.dumps(schema, sort_keys=True, default=str)
+    if key in _checked_schemas:
+        return
+    for error in _META_VALIDATOR.iter_errors(schema):
+        raise SchemaError.create_from(error)
+    _checked_schemas.add(key)
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcPrimitives:
     b: bool
     i: int
@@ -64,25 +85,7 @@ class DcPrimitives:
     s: str
 
 
-def test_get_schema_primitives():
-    schema = get_schema(DcPrimitives)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcPrimitives",
-        "properties": {
-            "b": {"type": "boolean"},
-            "i": {"type": "integer"},
-            "f": {"type": "number"},
-            "s": {"type": "string"},
-        },
-        "required": ["b", "i", "f", "s"],
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcOptional:
     a: int = 42
     b: int = dataclasses.field(default=42)
@@ -94,337 +97,97 @@ class DcOptional:
     h: tuple[int, float] = (1, 1.1)
 
 
-def test_get_schema_optional_fields():
-    """optional field === field with a default (!== t.Optional)"""
-    schema = get_schema(DcOptional)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcOptional",
-        "properties": {
-            "a": {"type": "integer", "default": 42},
-            "b": {"type": "integer", "default": 42},
-            "c": {"type": "integer"},
-            "d": {"type": "string", "default": "foo"},
-            "e": {"type": "boolean", "default": False},
-            "f": {"type": "null", "default": None},
-            "g": {"type": "number", "default": 1.1},
-            "h": {
-                "type": "array",
-                "prefixItems": [{"type": "integer"}, {"type": "number"}],
-                "minItems": 2,
-                "maxItems": 2,
-                "default": [1, 1.1],
-            },
-        },
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcUnion:
     a: int | str
 
 
-def test_get_schema_union():
-    schema = get_schema(DcUnion)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcUnion",
-        "properties": {"a": {"anyOf": [{"type": "integer"}, {"type": "string"}]}},
-        "required": ["a"],
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcNone:
     a: None
     b: int | None
     c: None | int
 
 
-def test_get_schema_nullable():
-    schema = get_schema(DcNone)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcNone",
-        "properties": {
-            "a": {"type": "null"},
-            "b": {"anyOf": [{"type": "integer"}, {"type": "null"}]},
-            "c": {"anyOf": [{"type": "null"}, {"type": "integer"}]},
-        },
-        "required": ["a", "b", "c"],
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcDict:
     a: dict
     b: dict[str, int]
 
 
-def test_get_schema_dict():
-    schema = get_schema(DcDict)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcDict",
-        "properties": {
-            "a": {"type": "object"},
-            "b": {"type": "object", "additionalProperties": {"type": "integer"}},
-        },
-        "required": ["a", "b"],
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcList:
     a: list
     b: list[bool]
 
 
-def test_get_schema_list():
-    schema = get_schema(DcList)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcList",
-        "properties": {
-            "a": {"type": "array"},
-            "b": {"type": "array", "items": {"type": "boolean"}},
-        },
-        "required": ["a", "b"],
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcTuple:
     a: tuple
     b: tuple[int, ...]
     c: tuple[int, bool, str]
 
 
-def test_get_schema_tuple():
-    schema = get_schema(DcTuple)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcTuple",
-        "properties": {
-            "a": {"type": "array"},
-            "b": {"type": "array", "items": {"type": "integer"}},
-            "c": {
-                "type": "array",
-                "prefixItems": [
-                    {"type": "integer"},
-                    {"type": "boolean"},
-                    {"type": "string"},
-                ],
-                "minItems": 3,
-                "maxItems": 3,
-            },
-        },
-        "required": ["a", "b", "c"],
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcRefsChild:
     c: str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcRefs:
     a: DcRefsChild
     b: list[DcRefsChild]
 
 
-def test_get_schema_refs():
-    schema = get_schema(DcRefs)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcRefs",
-        "properties": {
-            "a": {"$ref": "#/$defs/DcRefsChild"},
-            "b": {
-                "type": "array",
-                "items": {"$ref": "#/$defs/DcRefsChild"},
-            },
-        },
-        "required": ["a", "b"],
-        "$defs": {
-            "DcRefsChild": {
-                "type": "object",
-                "title": "DcRefsChild",
-                "properties": {"c": {"type": "string"}},
-                "required": ["c"],
-            }
-        },
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcRefsSelf:
     a: str
     b: DcRefsSelf | None
     c: list[DcRefsSelf]
 
 
-def test_get_schema_self_refs():
-    schema = get_schema(DcRefsSelf)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcRefsSelf",
-        "properties": {
-            "a": {"type": "string"},
-            "b": {"anyOf": [{"$ref": "#"}, {"type": "null"}]},
-            "c": {"type": "array", "items": {"$ref": "#"}},
-        },
-        "required": ["a", "b", "c"],
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcLiteral:
     a: t.Literal[1, "two", 3, None]
     b: t.Literal[42, 43] = 42
 
 
-def test_get_schema_literal():
-    schema = get_schema(DcLiteral)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcLiteral",
-        "properties": {
-            "a": {"enum": [1, "two", 3, None]},
-            "b": {"enum": [42, 43], "default": 42},
-        },
-        "required": ["a"],
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcAny:
     a: t.Any
     x: int | t.Any = 4
     b: t_e.Annotated[t.Any, Schema("B!!!")] = 5
 
 
-def test_get_schema_any():
-    schema = get_schema(DcAny)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcAny",
-        "properties": {
-            "a": {},
-            "b": {"default": 5, "title": "B!!!"},
-            "x": {"anyOf": [{"type": "integer"}, {}], "default": 4},
-        },
-        "required": ["a"],
-    }
-
-
 class MyEnum(enum.Enum):
     a = enum.auto()
     b = enum.auto()
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcEnum:
     a: MyEnum
     b: MyEnum = MyEnum.a
 
 
-def test_get_schema_enum():
-    schema = get_schema(DcEnum)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcEnum",
-        "properties": {
-            "a": {"$ref": "#/$defs/MyEnum"},
-            "b": {"$ref": "#/$defs/MyEnum", "default": 1},
-        },
-        "required": ["a"],
-        "$defs": {"MyEnum": {"title": "MyEnum", "enum": [1, 2]}},
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcSet:
     a: set
     b: set[int]
 
 
-def test_get_schema_set():
-    schema = get_schema(DcSet)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcSet",
-        "properties": {
-            "a": {"type": "array", "uniqueItems": True},
-            "b": {"type": "array", "items": {"type": "integer"}, "uniqueItems": True},
-        },
-        "required": ["a", "b"],
-    }
+DIGIT_PREFIX_PATTERN = r"^\d.*"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcStrAnnotated:
     a: t_e.Annotated[str, StringSchema(min_length=3, max_length=5)]
-    b: t_e.Annotated[str, StringSchema(format="date", pattern=r"^\d.*")] = "2000-01-01"
+    b: t_e.Annotated[str, StringSchema(format="date", pattern=DIGIT_PREFIX_PATTERN)] = (
+        "2000-01-01"
+    )
 
 
-def test_get_schema_str_annotation():
-    schema = get_schema(DcStrAnnotated)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcStrAnnotated",
-        "properties": {
-            "a": {"type": "string", "minLength": 3, "maxLength": 5},
-            "b": {
-                "type": "string",
-                "default": "2000-01-01",
-                "pattern": "^\\d.*",
-                "format": "date",
-            },
-        },
-        "required": ["a"],
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcNumberAnnotated:
     a: t_e.Annotated[int, NumberSchema(minimum=1, exclusive_maximum=11)]
     b: list[t_e.Annotated[int, NumberSchema(minimum=0)]]
@@ -434,58 +197,18 @@ class DcNumberAnnotated:
     ] = 33.1
 
 
-def test_get_schema_number_annotation():
-    schema = get_schema(DcNumberAnnotated)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcNumberAnnotated",
-        "properties": {
-            "a": {"type": "integer", "minimum": 1, "exclusiveMaximum": 11},
-            "b": {"type": "array", "items": {"type": "integer", "minimum": 0}},
-            "c": {"anyOf": [{"type": "integer", "minimum": 0}, {"type": "null"}]},
-            "d": {
-                "type": "number",
-                "default": 33.1,
-                "maximum": 12,
-                "exclusiveMinimum": 17,
-                "multipleOf": 5,
-            },
-        },
-        "required": ["a", "b", "c"],
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcDateTime:
     a: datetime.datetime
     b: datetime.date
 
 
-def test_get_schema_date_time():
-    schema = get_schema(DcDateTime)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcDateTime",
-        "properties": {
-            "a": {"type": "string", "format": "date-time"},
-            "b": {"type": "string", "format": "date"},
-        },
-        "required": ["a", "b"],
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcRegex:
     a: re.Pattern
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcNotImplemented:
     a: type(NotImplemented)
 
@@ -495,22 +218,7 @@ def test_not_implemented():
         get_schema(DcNotImplemented)
 
 
-def test_get_schema_regex():
-    schema = get_schema(DcRegex)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcRegex",
-        "properties": {
-            "a": {"type": "string", "format": "regex"},
-        },
-        "required": ["a"],
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcAnnotatedBook:
     title: t_e.Annotated[str, Schema(title="Title")]
 
@@ -520,7 +228,7 @@ class DcAnnotatedAuthorHobby(enum.Enum):
     SOCCER = "soccer"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcAnnotatedAuthor:
     name: t_e.Annotated[
         str,
@@ -535,64 +243,19 @@ class DcAnnotatedAuthor:
 
 
 def test_config_model_abc():
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True, frozen=True)
     class C:
         a: int
 
     assert isinstance(C(5), DataClass)
 
 
-def test_get_schema_annotation():
-    schema = get_schema(DcAnnotatedAuthor)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcAnnotatedAuthor",
-        "properties": {
-            "name": {
-                "type": "string",
-                "description": "the name of the author",
-                "examples": ["paul", "alice"],
-            },
-            "books": {
-                "type": "array",
-                "items": {"$ref": "#/$defs/DcAnnotatedBook"},
-                "description": "all the books the author has written",
-            },
-            "hobby": {
-                "$ref": "#/$defs/DcAnnotatedAuthorHobby",
-                "deprecated": True,
-            },
-            "age": {
-                "anyOf": [{"type": "integer"}, {"type": "number"}],
-                "default": 42,
-                "description": "age in years",
-            },
-        },
-        "required": ["name", "books", "hobby"],
-        "$defs": {
-            "DcAnnotatedBook": {
-                "type": "object",
-                "title": "DcAnnotatedBook",
-                "properties": {"title": {"type": "string", "title": "Title"}},
-                "required": ["title"],
-            },
-            "DcAnnotatedAuthorHobby": {
-                "title": "DcAnnotatedAuthorHobby",
-                "enum": ["chess", "soccer"],
-            },
-        },
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcSchemaConfigChild:
     a: int
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcSchemaConfig:
     a: str
     child_1: DcSchemaConfigChild
@@ -600,36 +263,7 @@ class DcSchemaConfig:
     friend: t_e.Annotated[DcSchemaConfig, Schema(title="a friend")]
 
 
-def test_get_schema_config():
-    schema = get_schema(DcSchemaConfig)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcSchemaConfig",
-        "properties": {
-            "a": {"type": "string"},
-            "child_1": {"$ref": "#/$defs/DcSchemaConfigChild"},
-            "child_2": {
-                "$ref": "#/$defs/DcSchemaConfigChild",
-                "title": "2nd child",
-            },
-            "friend": {"$ref": "#", "title": "a friend"},
-        },
-        "required": ["a", "child_1", "child_2", "friend"],
-        "$defs": {
-            "DcSchemaConfigChild": {
-                "type": "object",
-                "title": "DcSchemaConfigChild",
-                "properties": {"a": {"type": "integer"}},
-                "required": ["a"],
-            }
-        },
-    }
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcListAnnotation:
     a: t_e.Annotated[
         list[int],
@@ -638,45 +272,411 @@ class DcListAnnotation:
     b: t_e.Annotated[tuple[float, ...], ContainerSchema(min_items=3, max_items=10)] = ()
 
 
-def test_get_schema_list_annotation():
-    schema = get_schema(DcListAnnotation)
-    print(schema)
-    Draft202012Validator.check_schema(schema)
-    assert schema == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcListAnnotation",
-        "properties": {
-            "a": {
-                "type": "array",
-                "items": {"type": "integer"},
-                "minItems": 3,
-                "maxItems": 5,
-                "uniqueItems": True,
-            },
-            "b": {
-                "type": "array",
-                "items": {"type": "number"},
-                "default": [],
-                "minItems": 3,
-                "maxItems": 10,
-            },
+EXPECTED_DCPRIMITIVES = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcPrimitives",
+    "properties": {
+        "b": {"type": "boolean"},
+        "i": {"type": "integer"},
+        "f": {"type": "number"},
+        "s": {"type": "string"},
+    },
+    "required": ["b", "i", "f", "s"],
+}
+
+
+# optional field === field with a default (!== t.Optional)
+EXPECTED_DCOPTIONAL = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcOptional",
+    "properties": {
+        "a": {"type": "integer", "default": 42},
+        "b": {"type": "integer", "default": 42},
+        "c": {"type": "integer"},
+        "d": {"type": "string", "default": "foo"},
+        "e": {"type": "boolean", "default": False},
+        "f": {"type": "null", "default": None},
+        "g": {"type": "number", "default": 1.1},
+        "h": {
+            "type": "array",
+            "prefixItems": [{"type": "integer"}, {"type": "number"}],
+            "minItems": 2,
+            "maxItems": 2,
+            "default": [1, 1.1],
         },
-        "required": ["a"],
-    }
+    },
+}
+
+
+EXPECTED_DCUNION = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcUnion",
+    "properties": {"a": {"anyOf": [{"type": "integer"}, {"type": "string"}]}},
+    "required": ["a"],
+}
+
+
+EXPECTED_DCNONE = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcNone",
+    "properties": {
+        "a": {"type": "null"},
+        "b": {"anyOf": [{"type": "integer"}, {"type": "null"}]},
+        "c": {"anyOf": [{"type": "null"}, {"type": "integer"}]},
+    },
+    "required": ["a", "b", "c"],
+}
+
+
+EXPECTED_DCDICT = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcDict",
+    "properties": {
+        "a": {"type": "object"},
+        "b": {"type": "object", "additionalProperties": {"type": "integer"}},
+    },
+    "required": ["a", "b"],
+}
+
+
+EXPECTED_DCLIST = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcList",
+    "properties": {
+        "a": {"type": "array"},
+        "b": {"type": "array", "items": {"type": "boolean"}},
+    },
+    "required": ["a", "b"],
+}
+
+
+EXPECTED_DCTUPLE = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcTuple",
+    "properties": {
+        "a": {"type": "array"},
+        "b": {"type": "array", "items": {"type": "integer"}},
+        "c": {
+            "type": "array",
+            "prefixItems": [
+                {"type": "integer"},
+                {"type": "boolean"},
+                {"type": "string"},
+            ],
+            "minItems": 3,
+            "maxItems": 3,
+        },
+    },
+    "required": ["a", "b", "c"],
+}
+
+
+EXPECTED_DCREFS = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcRefs",
+    "properties": {
+        "a": {"$ref": "#/$defs/DcRefsChild"},
+        "b": {
+            "type": "array",
+            "items": {"$ref": "#/$defs/DcRefsChild"},
+        },
+    },
+    "required": ["a", "b"],
+    "$defs": {
+        "DcRefsChild": {
+            "type": "object",
+            "title": "DcRefsChild",
+            "properties": {"c": {"type": "string"}},
+            "required": ["c"],
+        }
+    },
+}
+
+
+EXPECTED_DCREFSSELF = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcRefsSelf",
+    "properties": {
+        "a": {"type": "string"},
+        "b": {"anyOf": [{"$ref": "#"}, {"type": "null"}]},
+        "c": {"type": "array", "items": {"$ref": "#"}},
+    },
+    "required": ["a", "b", "c"],
+}
+
+
+EXPECTED_DCLITERAL = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcLiteral",
+    "properties": {
+        "a": {"enum": [1, "two", 3, None]},
+        "b": {"enum": [42, 43], "default": 42},
+    },
+    "required": ["a"],
+}
+
+
+EXPECTED_DCANY = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcAny",
+    "properties": {
+        "a": {},
+        "b": {"default": 5, "title": "B!!!"},
+        "x": {"anyOf": [{"type": "integer"}, {}], "default": 4},
+    },
+    "required": ["a"],
+}
+
+
+EXPECTED_DCENUM = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcEnum",
+    "properties": {
+        "a": {"$ref": "#/$defs/MyEnum"},
+        "b": {"$ref": "#/$defs/MyEnum", "default": 1},
+    },
+    "required": ["a"],
+    "$defs": {"MyEnum": {"title": "MyEnum", "enum": [1, 2]}},
+}
+
+
+EXPECTED_DCSET = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcSet",
+    "properties": {
+        "a": {"type": "array", "uniqueItems": True},
+        "b": {
+            "type": "array",
+            "items": {"type": "integer"},
+            "uniqueItems": True,
+        },
+    },
+    "required": ["a", "b"],
+}
+
+
+EXPECTED_DCSTRANNOTATED = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcStrAnnotated",
+    "properties": {
+        "a": {"type": "string", "minLength": 3, "maxLength": 5},
+        "b": {
+            "type": "string",
+            "default": "2000-01-01",
+            "pattern": DIGIT_PREFIX_PATTERN,
+            "format": "date",
+        },
+    },
+    "required": ["a"],
+}
+
+
+EXPECTED_DCNUMBERANNOTATED = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcNumberAnnotated",
+    "properties": {
+        "a": {"type": "integer", "minimum": 1, "exclusiveMaximum": 11},
+        "b": {"type": "array", "items": {"type": "integer", "minimum": 0}},
+        "c": {"anyOf": [{"type": "integer", "minimum": 0}, {"type": "null"}]},
+        "d": {
+            "type": "number",
+            "default": 33.1,
+            "maximum": 12,
+            "exclusiveMinimum": 17,
+            "multipleOf": 5,
+        },
+    },
+    "required": ["a", "b", "c"],
+}
+
+
+EXPECTED_DCDATETIME = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcDateTime",
+    "properties": {
+        "a": {"type": "string", "format": "date-time"},
+        "b": {"type": "string", "format": "date"},
+    },
+    "required": ["a", "b"],
+}
+
+
+EXPECTED_DCREGEX = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcRegex",
+    "properties": {
+        "a": {"type": "string", "format": "regex"},
+    },
+    "required": ["a"],
+}
+
+
+EXPECTED_DCANNOTATEDAUTHOR = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcAnnotatedAuthor",
+    "properties": {
+        "name": {
+            "type": "string",
+            "description": "the name of the author",
+            "examples": ["paul", "alice"],
+        },
+        "books": {
+            "type": "array",
+            "items": {"$ref": "#/$defs/DcAnnotatedBook"},
+            "description": "all the books the author has written",
+        },
+        "hobby": {
+            "$ref": "#/$defs/DcAnnotatedAuthorHobby",
+            "deprecated": True,
+        },
+        "age": {
+            "anyOf": [{"type": "integer"}, {"type": "number"}],
+            "default": 42,
+            "description": "age in years",
+        },
+    },
+    "required": ["name", "books", "hobby"],
+    "$defs": {
+        "DcAnnotatedBook": {
+            "type": "object",
+            "title": "DcAnnotatedBook",
+            "properties": {"title": {"type": "string", "title": "Title"}},
+            "required": ["title"],
+        },
+        "DcAnnotatedAuthorHobby": {
+            "title": "DcAnnotatedAuthorHobby",
+            "enum": ["chess", "soccer"],
+        },
+    },
+}
+
+
+EXPECTED_DCSCHEMACONFIG = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcSchemaConfig",
+    "properties": {
+        "a": {"type": "string"},
+        "child_1": {"$ref": "#/$defs/DcSchemaConfigChild"},
+        "child_2": {
+            "$ref": "#/$defs/DcSchemaConfigChild",
+            "title": "2nd child",
+        },
+        "friend": {"$ref": "#", "title": "a friend"},
+    },
+    "required": ["a", "child_1", "child_2", "friend"],
+    "$defs": {
+        "DcSchemaConfigChild": {
+            "type": "object",
+            "title": "DcSchemaConfigChild",
+            "properties": {"a": {"type": "integer"}},
+            "required": ["a"],
+        }
+    },
+}
+
+
+EXPECTED_DCLISTANNOTATION = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcListAnnotation",
+    "properties": {
+        "a": {
+            "type": "array",
+            "items": {"type": "integer"},
+            "minItems": 3,
+            "maxItems": 5,
+            "uniqueItems": True,
+        },
+        "b": {
+            "type": "array",
+            "items": {"type": "number"},
+            "default": [],
+            "minItems": 3,
+            "maxItems": 10,
+        },
+    },
+    "required": ["a"],
+}
+
+
+SCHEMA_CASES: list[tuple[type[DataClass], dict[str, t.Any]]] = [
+    (DcPrimitives, EXPECTED_DCPRIMITIVES),
+    (DcOptional, EXPECTED_DCOPTIONAL),
+    (DcUnion, EXPECTED_DCUNION),
+    (DcNone, EXPECTED_DCNONE),
+    (DcDict, EXPECTED_DCDICT),
+    (DcList, EXPECTED_DCLIST),
+    (DcTuple, EXPECTED_DCTUPLE),
+    (DcRefs, EXPECTED_DCREFS),
+    (DcRefsSelf, EXPECTED_DCREFSSELF),
+    (DcLiteral, EXPECTED_DCLITERAL),
+    (DcAny, EXPECTED_DCANY),
+    (DcEnum, EXPECTED_DCENUM),
+    (DcSet, EXPECTED_DCSET),
+    (DcStrAnnotated, EXPECTED_DCSTRANNOTATED),
+    (DcNumberAnnotated, EXPECTED_DCNUMBERANNOTATED),
+    (DcDateTime, EXPECTED_DCDATETIME),
+    (DcRegex, EXPECTED_DCREGEX),
+    (DcAnnotatedAuthor, EXPECTED_DCANNOTATEDAUTHOR),
+    (DcSchemaConfig, EXPECTED_DCSCHEMACONFIG),
+    (DcListAnnotation, EXPECTED_DCLISTANNOTATION),
+]
+
+
+@pytest.mark.parametrize(
+    ("dc", "expected"), SCHEMA_CASES, ids=[dc.__name__ for dc, _ in SCHEMA_CASES]
+)
+def test_get_schema(dc: type[DataClass], expected: dict[str, t.Any]):
+    schema = get_schema(dc)
+    check_schema(schema)
+    assert schema == expected
+
+
+def test_from_dc_cache():
+    class TitledGen(NameOnlyGen):
+        def retrieve_title(self, typ: type) -> str:
+            return f"Titled {typ.__name__}"
+
+    schema = NameOnlyGen.from_dc(DcPrimitives)
+    schema["properties"].clear()
+    assert NameOnlyGen.from_dc(DcPrimitives) == EXPECTED_DCPRIMITIVES
 
+    titled = TitledGen.from_dc(DcPrimitives)
+    assert titled["title"] == "Titled DcPrimitives"
+    assert titled["properties"] == EXPECTED_DCPRIMITIVES["properties"]
+    assert NameOnlyGen.from_dc(DcPrimitives)["title"] == "DcPrimitives"
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcIncorrectStringAnnotation:
     price: t_e.Annotated[int, StringSchema(pattern=r"\d+")]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcIncorrectNumberAnnotation:
     price: t_e.Annotated[str, NumberSchema(maximum=10)]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcIncorrectContainerAnnotation:
     price: t_e.Annotated[int, ContainerSchema(max_items=5)]
 
@@ -691,7 +691,7 @@ def test_get_incorrect_annotation():
             get_schema(typ)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcProduct:
     price: t_e.Annotated[float, NumberSchema(minimum=0, maximum=5000)]
     """Price of the product."""
@@ -703,29 +703,32 @@ class DcProduct:
     """Category of the product."""
 
 
-def test_dc_docstring_merge():
-    assert get_schema(DcProduct) == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "type": "object",
-        "title": "DcProduct",
-        "properties": {
-            "price": {
-                "type": "number",
-                "minimum": 0,
-                "maximum": 5000,
-                "description": "Price of the product.",
-            },
-            "name": {
-                "type": "string",
-                "description": "Name of the product.",
-            },
-            "category": {
-                "type": "string",
-                "description": "Category of the product.",
-            },
+EXPECTED_DCPRODUCT = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "title": "DcProduct",
+    "properties": {
+        "price": {
+            "type": "number",
+            "minimum": 0,
+            "maximum": 5000,
+            "description": "Price of the product.",
         },
-        "required": ["price", "name", "category"],
-    }
+        "name": {
+            "type": "string",
+            "description": "Name of the product.",
+        },
+        "category": {
+            "type": "string",
+            "description": "Category of the product.",
+        },
+    },
+    "required": ["price", "name", "category"],
+}
+
+
+def test_dc_docstring_merge():
+    assert get_schema(DcProduct) == EXPECTED_DCPRODUCT
 
 
 class Book(t_e.TypedDict):
@@ -745,60 +748,63 @@ class Disc(t_e.TypedDict, total=False):
     songs: list[str]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcShelf:
     items: list[Book | Disc]
 
 
-def test_dc_gen_typed_dict():
-    assert get_schema(DcShelf) == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "$defs": {
-            "Book": {
-                "properties": {
-                    "author": {
-                        "description": "Book Author",
-                        "title": "Book Author",
-                        "type": "string",
-                    },
-                    "isbn": {"description": "ISBN Serial", "type": "string"},
-                    "name": {"description": "Book Name", "type": "string"},
-                    "year": {
-                        "description": "Publish Year",
-                        "maximum": 9999,
-                        "type": "integer",
-                    },
+EXPECTED_DCSHELF = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$defs": {
+        "Book": {
+            "properties": {
+                "author": {
+                    "description": "Book Author",
+                    "title": "Book Author",
+                    "type": "string",
                 },
-                "required": ["name", "isbn", "author"],
-                "title": "Book",
-                "type": "object",
-            },
-            "Disc": {
-                "properties": {
-                    "artists": {"items": {"type": "string"}, "type": "array"},
-                    "name": {"type": "string"},
-                    "songs": {"items": {"type": "string"}, "type": "array"},
+                "isbn": {"description": "ISBN Serial", "type": "string"},
+                "name": {"description": "Book Name", "type": "string"},
+                "year": {
+                    "description": "Publish Year",
+                    "maximum": 9999,
+                    "type": "integer",
                 },
-                "required": ["name"],
-                "title": "Disc",
-                "type": "object",
             },
+            "required": ["name", "isbn", "author"],
+            "title": "Book",
+            "type": "object",
         },
-        "properties": {
-            "items": {
-                "items": {
-                    "anyOf": [
-                        {"$ref": "#/$defs/Book"},
-                        {"$ref": "#/$defs/Disc"},
-                    ]
-                },
-                "type": "array",
-            }
+        "Disc": {
+            "properties": {
+                "artists": {"items": {"type": "string"}, "type": "array"},
+                "name": {"type": "string"},
+                "songs": {"items": {"type": "string"}, "type": "array"},
+            },
+            "required": ["name"],
+            "title": "Disc",
+            "type": "object",
         },
-        "required": ["items"],
-        "title": "DcShelf",
-        "type": "object",
-    }
+    },
+    "properties": {
+        "items": {
+            "items": {
+                "anyOf": [
+                    {"$ref": "#/$defs/Book"},
+                    {"$ref": "#/$defs/Disc"},
+                ]
+            },
+            "type": "array",
+        }
+    },
+    "required": ["items"],
+    "title": "DcShelf",
+    "type": "object",
+}
+
+
+def test_dc_gen_typed_dict():
+    assert get_schema(DcShelf) == EXPECTED_DCSHELF
 
 
 class StoreItem(t_e.TypedDict):
@@ -810,45 +816,48 @@ class StoreItem(t_e.TypedDict):
     """Item Price"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class DcStore:
     """Represents a store."""
 
     items: list[StoreItem]
 
 
-def test_dc_gen_with_cls_doc():
-    assert get_schema(DcStore) == {
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "$defs": {
-            "StoreItem": {
-                "properties": {
-                    "name": {"description": "Item Name", "type": "string"},
-                    "price": {"description": "Item Price", "type": "number"},
-                },
-                "required": ["name", "price"],
-                "title": "StoreItem",
-                "type": "object",
+EXPECTED_DCSTORE = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$defs": {
+        "StoreItem": {
+            "properties": {
+                "name": {"description": "Item Name", "type": "string"},
+                "price": {"description": "Item Price", "type": "number"},
             },
+            "required": ["name", "price"],
+            "title": "StoreItem",
+            "type": "object",
         },
-        "properties": {
+    },
+    "properties": {
+        "items": {
             "items": {
-                "items": {
-                    "$ref": "#/$defs/StoreItem",
-                },
-                "type": "array",
-            }
-        },
-        "required": ["items"],
-        "title": "DcStore",
-        "description": "Represents a store.",
-        "type": "object",
-    }
+                "$ref": "#/$defs/StoreItem",
+            },
+            "type": "array",
+        }
+    },
+    "required": ["items"],
+    "title": "DcStore",
+    "description": "Represents a store.",
+    "type": "object",
+}
+
+
+def test_dc_gen_with_cls_doc():
+    assert get_schema(DcStore) == EXPECTED_DCSTORE
 
 
 def test_dc_union_type():
 
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True, frozen=True)
     class DcOptional:
         """Represents an optional item."""
 
@@ -3,7 +3,7 @@ from pathlib import Path
 import pytest
 
 from kayaku.spec import (
-    FormattedPath,
+    DestWithMount,
     PathFill,
     PathSpec,
     SectionSpec,
@@ -15,12 +15,12 @@ from kayaku.spec import (
 
 def test_spec_parse():
     assert parse_source("{module.**}.secrets") == SourceSpec(
-        ["module"], ["secrets"], SectionSpec(["module"], [])
+        ("module",), ("secrets",), SectionSpec(("module",), ())
     )
 
-    assert parse_source("graia.{**}") == SourceSpec(["graia"], [], SectionSpec([], []))
+    assert parse_source("graia.{**}") == SourceSpec(("graia",), (), SectionSpec((), ()))
     assert parse_path("./config/modules/{}::config.{**}") == PathSpec(
-        [".", "config", "modules", PathFill.SINGLE], ["config", PathFill.EXTEND]
+        (".", "config", "modules", PathFill.SINGLE), ("config", PathFill.EXTEND)
     )
 
 
@@ -31,27 +31,26 @@ def test_parse_spec_err():
         parse_path("{**}::{**}")
 
 
-def test_format_path_spec():
-    base_pth = Path("./temp/spec/").resolve()
-    base_pth.mkdir(parents=True, exist_ok=True)
-    assert parse_path(base_pth.as_posix() + "/{}::config.{**}.{}.mock").format(
+@pytest.fixture(scope="module")
+def base_pth(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("spec")
+
+
+def test_format_path_spec(base_pth: Path):
+    base = base_pth.as_posix()
+    assert parse_path(base + "/{}::config.{**}.{}.mock").format(
         ["a", "b", "c", "d"]
-    ) == FormattedPath(Path(base_pth / "a"), ["config", "b", "c", "d", "mock"])
+    ) == DestWithMount(f"{base}/a", ("config", "b", "c", "d", "mock"))
 
-    assert parse_path(base_pth.as_posix() + "/{}::config.{}.mock").format(
-        ["a", "b"]
-    ) == FormattedPath(Path(base_pth / "a"), ["config", "b", "mock"])
+    assert parse_path(base + "/{}::config.{}.mock").format(["a", "b"]) == DestWithMount(
+        f"{base}/a", ("config", "b", "mock")
+    )
 
-    assert parse_path(base_pth.as_posix() + "/{**}::config.{}.{}.mock").format(
+    assert parse_path(base + "/{**}::config.{}.{}.mock").format(
         ["a", "b", "c", "d"]
-    ) == FormattedPath(Path(base_pth / "a/b"), ["config", "c", "d", "mock"])
+    ) == DestWithMount(f"{base}/a/b", ("config", "c", "d", "mock"))
 
-    assert (
-        parse_path(base_pth.as_posix() + "/{}:config.{}.mock").format(
-            ["a", "b", "c", "d"]
-        )
-        is None
+    assert parse_path(base + "/{}:config.{}.mock").format(["a", "b", "c", "d"]) is None
+    assert parse_path(base + "/{**}").format(["a", "b", "c"]) == DestWithMount(
+        f"{base}/a/b/c", ()
     )
-    assert parse_path(base_pth.as_posix() + "/{**}").format(
-        ["a", "b", "c"]
-    ) == FormattedPath(Path(base_pth / "a/b/c"), [])
@@ -1,15 +1,26 @@
 import re
-from copy import deepcopy
 from dataclasses import dataclass
 from datetime import date, datetime, time
 from enum import Enum
+from typing import Any
 
+import pytest
 from helper import prettifier
 
 from kayaku.backend import dumps, loads
-from kayaku.backend.types import JObject, JWrapper
+from kayaku.backend.types import Array, Integer, JObject, JString, JWrapper
 from kayaku.utils import copying_field, from_dict, update
 
+PRETTIFIER = prettifier()
+
+# Read-only JSON literals shared by the test payloads
+JTRUE = JWrapper(True)
+JNULL = JWrapper(None)
+
+RE_DIGITS = re.compile(r"(\d+)")
+RE_NAMED = re.compile(r"(?P<name>\d+)")
+RE_NAMED_LAZY = re.compile(r"(?P<name>.*?)")
+
 update_input = """\
 {
     "a": "b", // sigma
@@ -60,16 +71,20 @@ update_output = """\
 
 def test_json_update():
     o_obj = loads(update_input)
-    obj = deepcopy(o_obj)
-    del obj["f"]
-    obj["h"] = 4
-    obj["j"].pop()
-    obj["k"] = datetime(2022, 1, 1, 8, 0, 0)
-    obj["re"] = re.compile(r"(\d+)")
-    obj["p"].extend([1, 2, {"a": "b"}])
-    obj["q"] = Sub(1)
+    # Mirrors update_input with "f" dropped and a few values changed or added
+    obj = {
+        "a": "b",
+        "d": "e",
+        "h": 4,
+        "j": ["viva", {}],
+        "p": [1, 2, {"a": "b"}],
+        "v": {"a": 5},
+        "q": Sub(1),
+        "k": datetime(2022, 1, 1, 8, 0, 0),
+        "re": RE_DIGITS,
+    }
     update(o_obj, obj)
-    assert dumps(prettifier().prettify(o_obj)) == update_output
+    assert dumps(PRETTIFIER.prettify(o_obj)) == update_output
 
 
 class E(Enum):
@@ -108,77 +123,71 @@ class Obj2:
     i: dict[str, None | str]
 
 
-def test_extra_load():
-    dt_now = datetime.now()
-
-    obj = {
-        "a": 1,
-        "b": f"{dt_now.date().isoformat()}",
-        "c": f"{dt_now.time().isoformat()}",
-        "d": f"{dt_now.isoformat()}",
-        "e": r"(?P<name>\d+)",
-        "f": JWrapper(True),
-        "g": JWrapper(None),
-        "h": "abc",
-        "i": {"a": "a", "b": None},
-    }
-    target_obj = Obj2(
-        E.A,
-        dt_now.date(),
-        dt_now.time(),
-        dt_now,
-        re.compile(r"(?P<name>\d+)"),
-        True,
-        None,
-        "abc",
-        {"a": "a", "b": None},
-    )
-    o: Obj2 = from_dict(Obj2, obj)
-    assert o == target_obj
+DT_NOW = datetime.now()
+D_ISO = DT_NOW.date().isoformat()
+T_ISO = DT_NOW.time().isoformat()
+DT_ISO = DT_NOW.isoformat()
+
+EXTRA_LOAD_INPUT = {
+    "a": 1,
+    "b": D_ISO,
+    "c": T_ISO,
+    "d": DT_ISO,
+    "e": RE_NAMED.pattern,
+    "f": JTRUE,
+    "g": JNULL,
+    "h": "abc",
+}
+# Leading Obj / Obj2 fields shared by the load and update tests
+SHARED_ARGS = (E.A, DT_NOW.date(), DT_NOW.time(), DT_NOW, RE_NAMED)
+EXTRA_LOAD_ARGS = (*SHARED_ARGS, True, None, "abc")
+
+
+@pytest.mark.parametrize(
+    ("cls", "extra"),
+    [(Obj, {}), (Obj2, {"i": {"a": "a", "b": None}})],
+    ids=["Obj", "Obj2"],
+)
+def test_extra_load(cls: type[Obj | Obj2], extra: dict[str, Any]):
+    o = from_dict(cls, {**EXTRA_LOAD_INPUT, **extra})
+    assert o == cls(*EXTRA_LOAD_ARGS, **extra)
     assert o.f is True
     assert o.g is None
-    assert o.i["b"] is None
+    if isinstance(o, Obj2):
+        assert o.i["b"] is None
 
 
 def test_update_with_dc():
-    from kayaku.backend.types import Array, Integer, JString, JWrapper
-
-    dt_now = datetime.now()
     target_obj = Obj(
-        E.A,
-        dt_now.date(),
-        dt_now.time(),
-        dt_now,
-        re.compile(r"(?P<name>\d+)"),
-        [E.A, True, re.compile(r"(?P<name>.*?)"), dt_now, Sub(1), [5]],
-        None,
-        "abc",
+        *SHARED_ARGS, [E.A, True, RE_NAMED_LAZY, DT_NOW, Sub(1), [5]], None, "abc"
     )
     o = JObject()
     update(o, target_obj)
-    for k, v in JObject(
+    expected = JObject(
         {
             "a": Integer(1),
-            "b": JString(dt_now.date().isoformat()),
-            "c": JString(dt_now.time().isoformat()),
-            "d": JString(dt_now.isoformat()),
+            "b": JString(D_ISO),
+            "c": JString(T_ISO),
+            "d": JString(DT_ISO),
             "e": JString("(?P<name>\\d+)"),
             "f": Array(
                 [
                     Integer(1),
-                    JWrapper(True),
+                    JTRUE,
                     JString(r"(?P<name>.*?)"),
-                    JString(dt_now.isoformat()),
+                    JString(DT_ISO),
                     JObject({"a": Integer(1)}),
                     Array([Integer(5)]),
                 ]
             ),
-            "g": JWrapper(None),
+            "g": JNULL,
             "h": JString("abc"),
         }
-    ).items():
-        assert o[k] == v
-        assert o[k].__class__ == v.__class__
+    )
+    actual = JObject({k: o[k] for k in expected})
+    assert dumps(actual) == dumps(expected)
+    for (k, v), actual_v in zip(expected.items(), actual.values(), strict=True):
+        assert type(actual_v) is type(v), k
 
 
 def test_copying_field():